@@ -0,0 +1,57 @@
+"""
+Ahead-of-time compilation of the day count and roll convention kernels.
+
+Run with `python -m market_conventions.build_aot` to build the daycount_aot
+extension module next to this file. The modules that call these kernels
+(daycountconventions.py, schedule.py and date_utils.py) pick the extension up at
+import when present and otherwise fall back to the jitted kernels, so the
+extension only removes the JIT warmup on cold starts.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from .daycount_kernels import (
+    _civil_from_days,
+    _thirty360_array,
+    _thirty360_eu_array,
+    _thirty360_us_array,
+)
+from .roll_kernels import _fill_roll_links
+
+cc = CC("daycount_aot")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Signature of the 30/360 kernels over ScheduleSoA / ymd_columns columns. pycc exports do not
+# check argument dtypes, so callers must cast to exactly these (see _schedule_ymd).
+_THIRTY360_SIGNATURE = "void(i2[:], i1[:], i1[:], i2[:], i1[:], i1[:], f8[:])"
+
+
+@cc.export("civil_from_days", "void(i8[:], i2[:], i1[:], i1[:])")
+def civil_from_days(days, years, months, mdays):
+    _civil_from_days(days, years, months, mdays)
+
+
+@cc.export("thirty360_array", _THIRTY360_SIGNATURE)
+def thirty360_array(ys1, ms1, ds1, ys2, ms2, ds2, out):
+    _thirty360_array(ys1, ms1, ds1, ys2, ms2, ds2, out)
+
+
+@cc.export("thirty360_us_array", _THIRTY360_SIGNATURE)
+def thirty360_us_array(ys1, ms1, ds1, ys2, ms2, ds2, out):
+    _thirty360_us_array(ys1, ms1, ds1, ys2, ms2, ds2, out)
+
+
+@cc.export("thirty360_eu_array", _THIRTY360_SIGNATURE)
+def thirty360_eu_array(ys1, ms1, ds1, ys2, ms2, ds2, out):
+    _thirty360_eu_array(ys1, ms1, ds1, ys2, ms2, ds2, out)
+
+
+@cc.export("fill_roll_links", "void(b1[:], i1[:], i4[:], i4[:], i4[:], i4[:])")
+def fill_roll_links(is_bday, month_of, following, preceding, modified_following, modified_preceding):
+    _fill_roll_links(is_bday, month_of, following, preceding, modified_following, modified_preceding)
+
+
+if __name__ == "__main__":
+    cc.compile()
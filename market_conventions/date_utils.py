@@ -1,25 +1,274 @@
+import calendar
 import datetime
+import functools
+from typing import NamedTuple
+
+import numpy as np
+
+from .daycount_kernels import _civil_from_days
+from .roll_kernels import _fill_roll_links
+
+# Prefer the ahead-of-time compiled kernels (see build_aot.py) when they have been built
+try:
+    from .daycount_aot import civil_from_days as _civil_from_days
+    from .daycount_aot import fill_roll_links as _fill_roll_links
+except ImportError:
+    pass
+
+
+_UNIX_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+# Last day of every month from _LAST_DAY_BASE onwards, indexed (year - _LAST_DAY_BASE) * 12 + month - 1
+_LAST_DAY_BASE = 1900
+_LAST_DAY_YEARS = 300
+_LAST_DAY = [calendar.monthrange(y, m)[1] for y in range(_LAST_DAY_BASE, _LAST_DAY_BASE + _LAST_DAY_YEARS)
+             for m in range(1, 13)]
+
+
+def _month_last_day(year: int, month: int) -> int:
+    """
+    Last day of the given month, from the precomputed table where possible.
+    """
+    i = year - _LAST_DAY_BASE
+    if 0 <= i < _LAST_DAY_YEARS:
+        return _LAST_DAY[i * 12 + month - 1]
+    return calendar.monthrange(year, month)[1]
+
 
 def is_end_of_month(date: datetime.date) -> bool:
     """
     Check if a given date is the end of the month.
     """
-    next_day = date + datetime.timedelta(days=1)
-    return next_day.month != date.month
+    return date.day == _month_last_day(date.year, date.month)
 
-def end_of_month(date: datetime.date) -> bool:
+def end_of_month(date: datetime.date) -> datetime.date:
     """
-    Check if a given date is the end of the month.
+    Return the last day of the month of a given date.
     """
-    if is_end_of_month(date):
-        return date
-    else:
-        # Move to the last day of the month
-        last_day = (date.replace(day=1) + datetime.timedelta(days=32)).replace(day=1) - datetime.timedelta(days=1)
-        return last_day
+    return date.replace(day=_month_last_day(date.year, date.month))
 
-def is_business_day(date: datetime.date, holidays: set) -> bool:
+
+class FastDate(NamedTuple):
     """
-    Check if a given date is a business day (not a weekend or holiday).
+    Date with its ordinal and components extracted once, for hot-path day count and roll code.
+
+    Attributes:
+        ord (int): The proleptic Gregorian ordinal of the date.
+        y (int): The calendar year.
+        m (int): The calendar month.
+        d (int): The day of the month.
+    """
+
+    ord: int
+    y: int
+    m: int
+    d: int
+
+
+def fast(date: datetime.date) -> FastDate:
+    """
+    Convert a date to a FastDate.
+    """
+    return FastDate(date.toordinal(), date.year, date.month, date.day)
+
+
+def to_ordinals(dates) -> np.ndarray:
+    """
+    Convert an iterable of dates to an int32 array of proleptic Gregorian ordinals.
+    """
+    return np.fromiter((d.toordinal() for d in dates), dtype=np.int32)
+
+
+class BusinessDayCache:
+    """
+    Precomputed business day calendar covering a fixed date range.
+
+    The calendar is scanned once at construction, and every roll convention is resolved
+    for every position by the roll_kernels, so business day checks and date adjustments
+    are single array reads.
+
+    Attributes:
+        epoch (int): The ordinal of the first date covered (always a Monday).
+        is_bday (np.ndarray): Boolean flags, True where the date epoch + i is a business day.
+        next_bday (np.ndarray): Index of the first business day on or after i, -1 if none is in range.
+        prev_bday (np.ndarray): Index of the last business day on or before i, -1 if none is in range.
+        mod_following_bday (np.ndarray): Index of the Modified Following business day for i, -1 if none is in range.
+        mod_preceding_bday (np.ndarray): Index of the Modified Preceding business day for i, -1 if none is in range.
+        month_of (np.ndarray): Calendar month (1-12) of the date epoch + i.
+        fast_dates (list[FastDate]): FastDate of the date epoch + i, built on first use.
+    """
+
+    def __init__(self, holidays: set, dt_min: datetime.date, dt_max: datetime.date):
+        if dt_min > dt_max:
+            raise ValueError(f"dt_min {dt_min} is after dt_max {dt_max}.")
+        # Align the epoch to a Monday so weekends sit at fixed strides
+        self.epoch = dt_min.toordinal() - dt_min.weekday()
+        ndays = dt_max.toordinal() - self.epoch + 1
+
+        self.is_bday = np.ones(ndays, dtype=np.bool_)
+        self.is_bday[5::7] = False
+        self.is_bday[6::7] = False
+        holiday_index = [h.toordinal() - self.epoch for h in holidays]
+        self.is_bday[[i for i in holiday_index if 0 <= i < ndays]] = False
+
+        positions = np.arange(ndays, dtype=np.int64)
+        months = (positions + (self.epoch - _UNIX_EPOCH_ORDINAL)).astype("datetime64[D]").astype("datetime64[M]")
+        self.month_of = (months.astype(np.int64) % 12 + 1).astype(np.int8)
+
+        self.next_bday = np.empty(ndays, dtype=np.int32)
+        self.prev_bday = np.empty(ndays, dtype=np.int32)
+        self.mod_following_bday = np.empty(ndays, dtype=np.int32)
+        self.mod_preceding_bday = np.empty(ndays, dtype=np.int32)
+        _fill_roll_links(self.is_bday, self.month_of, self.next_bday, self.prev_bday,
+                         self.mod_following_bday, self.mod_preceding_bday)
+
+    def index(self, date: datetime.date) -> int:
+        """
+        Position of the given date in the calendar arrays.
+        """
+        i = date.toordinal() - self.epoch
+        if not 0 <= i < self.is_bday.shape[0]:
+            raise ValueError(f"{date} is outside the range of the business day calendar.")
+        return i
+
+    def to_date(self, i: int) -> datetime.date:
+        """
+        Date at the given position in the calendar arrays.
+        """
+        if i < 0:
+            raise ValueError("No business day within the range of the business day calendar.")
+        return datetime.date.fromordinal(self.epoch + int(i))
+
+    def index_fast(self, date: FastDate) -> int:
+        """
+        Position of the given FastDate in the calendar arrays, read from its ordinal.
+        """
+        i = date.ord - self.epoch
+        if not 0 <= i < self.is_bday.shape[0]:
+            raise ValueError(f"{date} is outside the range of the business day calendar.")
+        return i
+
+    def to_fast(self, i: int) -> FastDate:
+        """
+        FastDate at the given position in the calendar arrays.
+        """
+        if i < 0:
+            raise ValueError("No business day within the range of the business day calendar.")
+        return self.fast_dates[i]
+
+    @functools.cached_property
+    def fast_dates(self) -> list[FastDate]:
+        ndays = self.is_bday.shape[0]
+        days = np.arange(ndays, dtype=np.int64) + (self.epoch - _UNIX_EPOCH_ORDINAL)
+        years = np.empty(ndays, dtype=np.int16)
+        months = np.empty(ndays, dtype=np.int8)
+        mdays = np.empty(ndays, dtype=np.int8)
+        _civil_from_days(days, years, months, mdays)
+        ords = range(self.epoch, self.epoch + ndays)
+        return list(map(FastDate, ords, years.tolist(), months.tolist(), mdays.tolist()))
+
+    def index_array(self, ordinals: np.ndarray) -> np.ndarray:
+        """
+        Positions of the given date ordinals in the calendar arrays.
+        """
+        i = np.asarray(ordinals, dtype=np.int64) - self.epoch
+        if i.size and (i.min() < 0 or i.max() >= self.is_bday.shape[0]):
+            raise ValueError("Dates are outside the range of the business day calendar.")
+        return i
+
+    def ordinal_array(self, i: np.ndarray) -> np.ndarray:
+        """
+        Date ordinals at the given positions in the calendar arrays.
+        """
+        if i.size and i.min() < 0:
+            raise ValueError("No business day within the range of the business day calendar.")
+        return (i + self.epoch).astype(np.int32)
+
+    def following(self, date: datetime.date) -> datetime.date:
+        """
+        First business day on or after the given date.
+        """
+        return self.to_date(self.next_bday[self.index(date)])
+
+    def following_fast(self, date: FastDate) -> FastDate:
+        """
+        First business day on or after the given FastDate.
+        """
+        return self.to_fast(self.next_bday[self.index_fast(date)])
+
+    def preceding(self, date: datetime.date) -> datetime.date:
+        """
+        Last business day on or before the given date.
+        """
+        return self.to_date(self.prev_bday[self.index(date)])
+
+    def preceding_fast(self, date: FastDate) -> FastDate:
+        """
+        Last business day on or before the given FastDate.
+        """
+        return self.to_fast(self.prev_bday[self.index_fast(date)])
+
+    def modified_following(self, date: datetime.date) -> datetime.date:
+        """
+        First business day on or after the given date, unless it falls in the next month,
+        in which case the last business day before the given date.
+        """
+        return self.to_date(self.mod_following_bday[self.index(date)])
+
+    def modified_following_fast(self, date: FastDate) -> FastDate:
+        """
+        Modified Following business day for the given FastDate.
+        """
+        return self.to_fast(self.mod_following_bday[self.index_fast(date)])
+
+    def modified_preceding(self, date: datetime.date) -> datetime.date:
+        """
+        Last business day on or before the given date, unless it falls in the previous month,
+        in which case the first business day after the given date.
+        """
+        return self.to_date(self.mod_preceding_bday[self.index(date)])
+
+    def modified_preceding_fast(self, date: FastDate) -> FastDate:
+        """
+        Modified Preceding business day for the given FastDate.
+        """
+        return self.to_fast(self.mod_preceding_bday[self.index_fast(date)])
+
+    def following_array(self, ordinals: np.ndarray) -> np.ndarray:
+        """
+        Vectorized following(), taking and returning date ordinals.
+        """
+        return self.ordinal_array(self.next_bday[self.index_array(ordinals)])
+
+    def preceding_array(self, ordinals: np.ndarray) -> np.ndarray:
+        """
+        Vectorized preceding(), taking and returning date ordinals.
+        """
+        return self.ordinal_array(self.prev_bday[self.index_array(ordinals)])
+
+    def modified_following_array(self, ordinals: np.ndarray) -> np.ndarray:
+        """
+        Vectorized modified_following(), taking and returning date ordinals.
+        """
+        return self.ordinal_array(self.mod_following_bday[self.index_array(ordinals)])
+
+    def modified_preceding_array(self, ordinals: np.ndarray) -> np.ndarray:
+        """
+        Vectorized modified_preceding(), taking and returning date ordinals.
+        """
+        return self.ordinal_array(self.mod_preceding_bday[self.index_array(ordinals)])
+
+
+def _is_business_day_set(date: datetime.date, holidays: set) -> bool:
+    """
+    is_business_day for a holiday set only, for loops that have already dispatched on the holidays type.
     """
     return date.weekday() < 5 and date not in holidays
+
+def is_business_day(date: datetime.date, holidays: set | BusinessDayCache) -> bool:
+    """
+    Check if a given date is a business day (not a weekend or holiday).
+    """
+    if isinstance(holidays, BusinessDayCache):
+        return bool(holidays.is_bday[holidays.index(date)])
+    return _is_business_day_set(date, holidays)
@@ -0,0 +1,85 @@
+"""
+Numba kernels for the day count conventions in daycountconventions.py.
+
+The kernels operate on plain integers (year/month/day components) so they
+compile in nopython mode. Signatures are declared up front so compilation happens
+at import rather than on the first call. The scalar kernels are meant to be called
+from other jitted code such as the array loops below; calling them one pair at a
+time from Python is slower than plain Python arithmetic because of the dispatch.
+"""
+
+import numpy as np
+from numba import njit, float64, int8, int16, int64, uint64, void
+
+# Days in each year from _YEAR_LEN_BASE onwards, so Actual/Actual avoids the leap year test
+_YEAR_LEN_BASE = 1900
+_YEARS = np.arange(_YEAR_LEN_BASE, 2200)
+_YEAR_LEN = np.where(((_YEARS % 4 == 0) & (_YEARS % 100 != 0)) | (_YEARS % 400 == 0), 366, 365).astype(np.int16)
+
+
+@njit(float64(int64, int64, int64, int64, int64, int64), cache=True)
+def _thirty360(y1, m1, d1, y2, m2, d2):
+    d1 = min(d1, 30)
+    d2 = min(d2, 30)
+    return ((360 * (y2 - y1)) + (30 * (m2 - m1)) + (d2 - d1)) / 360.0
+
+
+@njit(float64(int64, int64, int64, int64, int64, int64), cache=True)
+def _thirty360_us(y1, m1, d1, y2, m2, d2):
+    # Branchless clamping: d2 drops to 30 only when it is 31 and d1 is 30 or 31
+    d2 = d2 - ((d2 == 31) & (d1 >= 30))
+    d1 = min(d1, 30)
+    return ((360 * (y2 - y1)) + (30 * (m2 - m1)) + (d2 - d1)) / 360.0
+
+
+@njit(float64(int64, int64, int64, int64, int64, int64), cache=True)
+def _thirty360_eu(y1, m1, d1, y2, m2, d2):
+    d1 = min(d1, 30)
+    d2 = min(d2, 30)
+    return ((360 * (y2 - y1)) + (30 * (m2 - m1)) + (d2 - d1)) / 360.0
+
+
+# Unsigned constants for _civil_from_days; mixing uint64 with int64 literals would promote to float64
+_U2, _U4, _U5, _U100, _U153, _U365 = (np.uint64(n) for n in (2, 4, 5, 100, 153, 365))
+_U1460, _U36524, _U146096, _U146097 = (np.uint64(n) for n in (1460, 36524, 146096, 146097))
+
+
+@njit(void(int64[:], int16[:], int8[:], int8[:]), cache=True)
+def _civil_from_days(days, years, months, mdays):
+    # Days since 1970-01-01 to proleptic Gregorian year/month/day (Hinnant's civil_from_days),
+    # which avoids the slow datetime64[M] and datetime64[Y] casts. Shifting to 0000-03-01
+    # keeps every date from year 1 non-negative, so the divisions can be unsigned. Callers
+    # must keep days within 0001-01-01..9999-12-31 (see schedule.ymd_columns).
+    for i in range(days.shape[0]):
+        z = uint64(days[i] + 719468)
+        era = z // _U146097
+        doe = z - era * _U146097
+        yoe = (doe - doe // _U1460 + doe // _U36524 - doe // _U146096) // _U365
+        doy = doe - (_U365 * yoe + yoe // _U4 - yoe // _U100)
+        mp = (_U5 * doy + _U2) // _U153
+        m = int64(mp) + 3 if mp < 10 else int64(mp) - 9
+        years[i] = int64(era) * 400 + int64(yoe) + (m <= 2)
+        months[i] = m
+        mdays[i] = int64(doy - (_U153 * mp + _U2) // _U5) + 1
+
+
+# Array kernels take the compact ScheduleSoA columns, the same signature build_aot.py exports
+_ARRAY_SIGNATURE = void(int16[:], int8[:], int8[:], int16[:], int8[:], int8[:], float64[:])
+
+
+@njit(_ARRAY_SIGNATURE, cache=True)
+def _thirty360_array(ys1, ms1, ds1, ys2, ms2, ds2, out):
+    for i in range(out.shape[0]):
+        out[i] = _thirty360(ys1[i], ms1[i], ds1[i], ys2[i], ms2[i], ds2[i])
+
+
+@njit(_ARRAY_SIGNATURE, cache=True)
+def _thirty360_us_array(ys1, ms1, ds1, ys2, ms2, ds2, out):
+    for i in range(out.shape[0]):
+        out[i] = _thirty360_us(ys1[i], ms1[i], ds1[i], ys2[i], ms2[i], ds2[i])
+
+
+@njit(_ARRAY_SIGNATURE, cache=True)
+def _thirty360_eu_array(ys1, ms1, ds1, ys2, ms2, ds2, out):
+    for i in range(out.shape[0]):
+        out[i] = _thirty360_eu(ys1[i], ms1[i], ds1[i], ys2[i], ms2[i], ds2[i])
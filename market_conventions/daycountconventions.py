@@ -8,6 +8,31 @@ This module implements day count conventions as described in the book.
 import datetime
 from enum import Enum
 
+import numpy as np
+
+from .daycount_kernels import (
+    _YEAR_LEN,
+    _YEAR_LEN_BASE,
+    _thirty360_array,
+    _thirty360_eu_array,
+    _thirty360_us_array,
+)
+from .date_utils import FastDate
+from .schedule import ScheduleSoA, ymd_columns
+
+# Prefer the ahead-of-time compiled kernels (see build_aot.py) when they have been built
+try:
+    from .daycount_aot import (
+        thirty360_array as _thirty360_array,
+        thirty360_eu_array as _thirty360_eu_array,
+        thirty360_us_array as _thirty360_us_array,
+    )
+except ImportError:
+    pass
+
+# Plain tuple copy of _YEAR_LEN for the scalar path, where indexing NumPy arrays is slow
+_YEAR_LENGTHS = tuple(_YEAR_LEN.tolist())
+
 
 class DayCountConvention(Enum):
     ACTUAL_360 = "Actual/360"
@@ -18,11 +43,76 @@ class DayCountConvention(Enum):
     THIRTY_360_EU = "30/360 European"
 
 
+def _to_days(dates) -> np.ndarray:
+    """
+    Convert an array-like of dates to a datetime64[D] array.
+    """
+    return np.asarray(dates, dtype="datetime64[D]")
+
+
+def _year_length_array(years: np.ndarray) -> np.ndarray:
+    """
+    Number of days in each of the given years.
+    """
+    i = years - _YEAR_LEN_BASE
+    if i.size == 0 or (i.min() >= 0 and i.max() < _YEAR_LEN.shape[0]):
+        return _YEAR_LEN[i]
+    is_leap = ((years % 4 == 0) & (years % 100 != 0)) | (years % 400 == 0)
+    return np.where(is_leap, 366, 365)
+
+
+def _check_schedules(starts: ScheduleSoA, ends: ScheduleSoA):
+    """
+    Ensure two schedules can be paired element-wise.
+    """
+    if len(starts) != len(ends):
+        raise ValueError("Start and end schedules must have the same length.")
+
+
+def _schedule_ymd(schedule: ScheduleSoA) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Year (int16), month (int8) and day (int8) columns of a schedule.
+
+    The ahead-of-time kernels are exported for these dtypes only and do not check their
+    arguments, so the columns are cast before every kernel call.
+    """
+    return (
+        schedule.years.astype(np.int16, copy=False),
+        schedule.months.astype(np.int8, copy=False),
+        schedule.days.astype(np.int8, copy=False),
+    )
+
+
+def _thirty360_schedule(kernel, starts: ScheduleSoA, ends: ScheduleSoA) -> np.ndarray:
+    """
+    Run a 30/360 array kernel over the year, month and day columns of two schedules.
+    """
+    _check_schedules(starts, ends)
+    out = np.empty(len(starts), dtype=np.float64)
+    kernel(*_schedule_ymd(starts), *_schedule_ymd(ends), out)
+    return out
+
+
+def _thirty360_batch(kernel, start_dates, end_dates) -> np.ndarray:
+    """
+    Run a 30/360 array kernel over broadcast start and end dates.
+    """
+    start_dates, end_dates = np.broadcast_arrays(_to_days(start_dates), _to_days(end_dates))
+    y1, m1, d1 = ymd_columns(start_dates)
+    y2, m2, d2 = ymd_columns(end_dates)
+    out = np.empty(start_dates.size, dtype=np.float64)
+    kernel(y1, m1, d1, y2, m2, d2, out)
+    return out.reshape(start_dates.shape)
+
+
 class DayCount:
     """
     Base class for day count conventions.
     """
 
+    __slots__ = ()
+
+    @staticmethod
     def yearFraction(start_date: datetime.date, end_date: datetime.date) -> float:
         """
         Calculate the year fraction between two dates.
@@ -30,6 +120,30 @@ class DayCount:
         """
         raise NotImplementedError("Subclasses should implement this method.")
 
+    @staticmethod
+    def yearFractionFast(start_date: FastDate, end_date: FastDate) -> float:
+        """
+        Calculate the year fraction between two FastDates.
+        This method should be overridden by subclasses to implement specific day count conventions.
+        """
+        raise NotImplementedError("Subclasses should implement this method.")
+
+    @classmethod
+    def yearFractionArray(cls, start_dates: np.ndarray, end_dates: np.ndarray) -> np.ndarray:
+        """
+        Calculate the year fractions between two arrays of dates (datetime64[D]) element-wise.
+        This method should be overridden by subclasses to implement specific day count conventions.
+        """
+        raise NotImplementedError("Subclasses should implement this method.")
+
+    @classmethod
+    def yearFractionSchedule(cls, starts: ScheduleSoA, ends: ScheduleSoA) -> np.ndarray:
+        """
+        Calculate the year fractions between two schedules of the same length element-wise.
+        This method should be overridden by subclasses to implement specific day count conventions.
+        """
+        raise NotImplementedError("Subclasses should implement this method.")
+
     def __repr__(self):
         return f"{self.__class__.__name__}()"
     
@@ -39,38 +153,105 @@ class Actual360(DayCount):
     Actual/360 day count convention.
     """
 
+    __slots__ = ()
+
+    @staticmethod
     def yearFraction(start_date: datetime.date, end_date: datetime.date) -> float:
         time_delta = (end_date - start_date).days
         return time_delta / 360.0
-    
+
+    @staticmethod
+    def yearFractionFast(start_date: FastDate, end_date: FastDate) -> float:
+        return (end_date.ord - start_date.ord) / 360.0
+
+    @classmethod
+    def yearFractionArray(cls, start_dates: np.ndarray, end_dates: np.ndarray) -> np.ndarray:
+        start_dates = _to_days(start_dates)
+        end_dates = _to_days(end_dates)
+        return (end_dates - start_dates).astype(np.int64) / 360.0
+
+    @classmethod
+    def yearFractionSchedule(cls, starts: ScheduleSoA, ends: ScheduleSoA) -> np.ndarray:
+        _check_schedules(starts, ends)
+        return (ends.ords - starts.ords) / 360.0
+
 
 class Actual365(DayCount):
     """
     Actual/365 Fixed day count convention.
     """
 
+    __slots__ = ()
+
+    @staticmethod
     def yearFraction(start_date: datetime.date, end_date: datetime.date) -> float:
         time_delta = (end_date - start_date).days
         return time_delta / 365.0
 
+    @staticmethod
+    def yearFractionFast(start_date: FastDate, end_date: FastDate) -> float:
+        return (end_date.ord - start_date.ord) / 365.0
+
+    @classmethod
+    def yearFractionArray(cls, start_dates: np.ndarray, end_dates: np.ndarray) -> np.ndarray:
+        start_dates = _to_days(start_dates)
+        end_dates = _to_days(end_dates)
+        return (end_dates - start_dates).astype(np.int64) / 365.0
+
+    @classmethod
+    def yearFractionSchedule(cls, starts: ScheduleSoA, ends: ScheduleSoA) -> np.ndarray:
+        _check_schedules(starts, ends)
+        return (ends.ords - starts.ords) / 365.0
+
 
 class ActualActual(DayCount):
     """
     Actual/Actual day count convention.
     """
 
+    __slots__ = ()
+
+    @staticmethod
     def yearFraction(start_date: datetime.date, end_date: datetime.date) -> float:
         time_delta = (end_date - start_date).days
-        # Calculate the number of days in the year of the start date
-        year_length = 366 if (start_date.year % 4 == 0 and (start_date.year % 100 != 0 or start_date.year % 400 == 0)) else 365
+        i = start_date.year - _YEAR_LEN_BASE
+        if 0 <= i < len(_YEAR_LENGTHS):
+            year_length = _YEAR_LENGTHS[i]
+        else:
+            year_length = 366 if (start_date.year % 4 == 0 and (start_date.year % 100 != 0 or start_date.year % 400 == 0)) else 365
         return time_delta / year_length
 
+    @staticmethod
+    def yearFractionFast(start_date: FastDate, end_date: FastDate) -> float:
+        i = start_date.y - _YEAR_LEN_BASE
+        if 0 <= i < len(_YEAR_LENGTHS):
+            year_length = _YEAR_LENGTHS[i]
+        else:
+            year_length = 366 if (start_date.y % 4 == 0 and (start_date.y % 100 != 0 or start_date.y % 400 == 0)) else 365
+        return (end_date.ord - start_date.ord) / year_length
+
+    @classmethod
+    def yearFractionArray(cls, start_dates: np.ndarray, end_dates: np.ndarray) -> np.ndarray:
+        start_dates = _to_days(start_dates)
+        end_dates = _to_days(end_dates)
+        time_delta = (end_dates - start_dates).astype(np.int64)
+        years = start_dates.astype("datetime64[Y]").astype(np.int64) + 1970
+        return time_delta / _year_length_array(years)
+
+    @classmethod
+    def yearFractionSchedule(cls, starts: ScheduleSoA, ends: ScheduleSoA) -> np.ndarray:
+        _check_schedules(starts, ends)
+        return (ends.ords - starts.ords) / _year_length_array(starts.years.astype(np.int64))
+
 
 class Thirty360(DayCount):
     """
     30/360 day count convention.
     """
 
+    __slots__ = ()
+
+    @staticmethod
     def yearFraction(start_date: datetime.date, end_date: datetime.date) -> float:
         d1 = min(start_date.day, 30)
         d2 = min(end_date.day, 30)
@@ -81,12 +262,29 @@ class Thirty360(DayCount):
 
         return ((360 * (y2 - y1)) + (30 * (m2 - m1)) + (d2 - d1)) / 360.0
 
+    @staticmethod
+    def yearFractionFast(start_date: FastDate, end_date: FastDate) -> float:
+        d1 = min(start_date.d, 30)
+        d2 = min(end_date.d, 30)
+        return ((360 * (end_date.y - start_date.y)) + (30 * (end_date.m - start_date.m)) + (d2 - d1)) / 360.0
+
+    @classmethod
+    def yearFractionArray(cls, start_dates: np.ndarray, end_dates: np.ndarray) -> np.ndarray:
+        return _thirty360_batch(_thirty360_array, start_dates, end_dates)
+
+    @classmethod
+    def yearFractionSchedule(cls, starts: ScheduleSoA, ends: ScheduleSoA) -> np.ndarray:
+        return _thirty360_schedule(_thirty360_array, starts, ends)
+
 
 class Thirty360US(DayCount):
     """
     30/360 US day count convention.
     """
 
+    __slots__ = ()
+
+    @staticmethod
     def yearFraction(start_date: datetime.date, end_date: datetime.date) -> float:
         d1 = start_date.day
         d2 = end_date.day
@@ -102,12 +300,33 @@ class Thirty360US(DayCount):
 
         return ((360 * (y2 - y1)) + (30 * (m2 - m1)) + (d2 - d1)) / 360.0
 
-    
+    @staticmethod
+    def yearFractionFast(start_date: FastDate, end_date: FastDate) -> float:
+        d1 = start_date.d
+        d2 = end_date.d
+        if d1 == 31:
+            d1 = 30
+        if d2 == 31 and d1 == 30:
+            d2 = 30
+        return ((360 * (end_date.y - start_date.y)) + (30 * (end_date.m - start_date.m)) + (d2 - d1)) / 360.0
+
+    @classmethod
+    def yearFractionArray(cls, start_dates: np.ndarray, end_dates: np.ndarray) -> np.ndarray:
+        return _thirty360_batch(_thirty360_us_array, start_dates, end_dates)
+
+    @classmethod
+    def yearFractionSchedule(cls, starts: ScheduleSoA, ends: ScheduleSoA) -> np.ndarray:
+        return _thirty360_schedule(_thirty360_us_array, starts, ends)
+
+
 class Thirty360EU(DayCount):
     """
     30/360 European day count convention.
     """
 
+    __slots__ = ()
+
+    @staticmethod
     def yearFraction(start_date: datetime.date, end_date: datetime.date) -> float:
         d1 = min(start_date.day, 30)
         d2 = min(end_date.day, 30)
@@ -116,10 +335,43 @@ class Thirty360EU(DayCount):
         y1 = start_date.year
         y2 = end_date.year
 
-        if d1 == 31:
-            d1 = 30
-        if d2 == 31:
-            d2 = 30
-
         return ((360 * (y2 - y1)) + (30 * (m2 - m1)) + (d2 - d1)) / 360.0
-    
\ No newline at end of file
+
+    @staticmethod
+    def yearFractionFast(start_date: FastDate, end_date: FastDate) -> float:
+        d1 = min(start_date.d, 30)
+        d2 = min(end_date.d, 30)
+        return ((360 * (end_date.y - start_date.y)) + (30 * (end_date.m - start_date.m)) + (d2 - d1)) / 360.0
+
+    @classmethod
+    def yearFractionArray(cls, start_dates: np.ndarray, end_dates: np.ndarray) -> np.ndarray:
+        return _thirty360_batch(_thirty360_eu_array, start_dates, end_dates)
+
+    @classmethod
+    def yearFractionSchedule(cls, starts: ScheduleSoA, ends: ScheduleSoA) -> np.ndarray:
+        return _thirty360_schedule(_thirty360_eu_array, starts, ends)
+
+
+actual_360 = Actual360.yearFraction
+actual_365 = Actual365.yearFraction
+actual_actual = ActualActual.yearFraction
+thirty_360 = Thirty360.yearFraction
+thirty_360_us = Thirty360US.yearFraction
+thirty_360_eu = Thirty360EU.yearFraction
+
+
+ACT360 = Actual360()
+ACT365 = Actual365()
+ACTACT = ActualActual()
+THIRTY360 = Thirty360()
+THIRTY360US = Thirty360US()
+THIRTY360EU = Thirty360EU()
+
+DAY_COUNTS = {
+    DayCountConvention.ACTUAL_360: ACT360,
+    DayCountConvention.ACTUAL_365: ACT365,
+    DayCountConvention.ACTUAL_ACTUAL: ACTACT,
+    DayCountConvention.THIRTY_360: THIRTY360,
+    DayCountConvention.THIRTY_360_US: THIRTY360US,
+    DayCountConvention.THIRTY_360_EU: THIRTY360EU,
+}
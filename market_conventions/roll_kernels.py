@@ -0,0 +1,59 @@
+"""
+Numba kernels for the roll conventions in rollconvention.py.
+
+The kernels work on positions in the arrays of a date_utils.BusinessDayCache
+(is_bday and month_of) instead of datetime.date objects and holiday sets, so
+roll loops inside other jitted code compile in nopython mode. Adjusted positions
+are returned, or -1 when no business day is within the calendar range.
+BusinessDayCache runs them once per position through _fill_roll_links.
+"""
+
+from numba import njit, boolean, int8, int32, int64, void
+
+
+@njit(boolean(int64, boolean[:]), cache=True)
+def _is_business_day(i, is_bday):
+    return 0 <= i < is_bday.shape[0] and is_bday[i]
+
+
+@njit(int64(int64, boolean[:]), cache=True)
+def _following(i, is_bday):
+    while 0 <= i < is_bday.shape[0]:
+        if _is_business_day(i, is_bday):
+            return i
+        i += 1
+    return -1
+
+
+@njit(int64(int64, boolean[:]), cache=True)
+def _preceding(i, is_bday):
+    while 0 <= i < is_bday.shape[0]:
+        if _is_business_day(i, is_bday):
+            return i
+        i -= 1
+    return -1
+
+
+@njit(int64(int64, boolean[:], int8[:]), cache=True)
+def _modified_following(i, is_bday, month_of):
+    j = _following(i, is_bday)
+    if j >= 0 and month_of[j] != month_of[i]:
+        j = _preceding(i, is_bday)
+    return j
+
+
+@njit(int64(int64, boolean[:], int8[:]), cache=True)
+def _modified_preceding(i, is_bday, month_of):
+    j = _preceding(i, is_bday)
+    if j >= 0 and month_of[j] != month_of[i]:
+        j = _following(i, is_bday)
+    return j
+
+
+@njit(void(boolean[:], int8[:], int32[:], int32[:], int32[:], int32[:]), cache=True)
+def _fill_roll_links(is_bday, month_of, following, preceding, modified_following, modified_preceding):
+    for i in range(is_bday.shape[0]):
+        following[i] = _following(i, is_bday)
+        preceding[i] = _preceding(i, is_bday)
+        modified_following[i] = _modified_following(i, is_bday, month_of)
+        modified_preceding[i] = _modified_preceding(i, is_bday, month_of)
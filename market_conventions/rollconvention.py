@@ -1,5 +1,56 @@
 import datetime
-import date_utils
+import functools
+
+import numpy as np
+
+from .date_utils import BusinessDayCache, FastDate, _is_business_day_set, fast
+
+
+_ONE_DAY = datetime.timedelta(days=1)
+
+
+# Roll loops for holiday sets. adjustDay dispatches on the holidays type before
+# calling them, so each stepped day only pays for the set lookup.
+def _following_loop(date: datetime.date, holidays: set | frozenset) -> datetime.date:
+    while not _is_business_day_set(date, holidays):
+        date += _ONE_DAY
+    return date
+
+
+def _modified_following_loop(date: datetime.date, holidays: set | frozenset) -> datetime.date:
+    original_month = date.month
+    while not _is_business_day_set(date, holidays):
+        date += _ONE_DAY
+    if date.month != original_month:
+        date -= _ONE_DAY
+        while not _is_business_day_set(date, holidays):
+            date -= _ONE_DAY
+    return date
+
+
+def _preceding_loop(date: datetime.date, holidays: set | frozenset) -> datetime.date:
+    while not _is_business_day_set(date, holidays):
+        date -= _ONE_DAY
+    return date
+
+
+def _modified_preceding_loop(date: datetime.date, holidays: set | frozenset) -> datetime.date:
+    original_month = date.month
+    while not _is_business_day_set(date, holidays):
+        date -= _ONE_DAY
+    if date.month != original_month:
+        date += _ONE_DAY
+        while not _is_business_day_set(date, holidays):
+            date += _ONE_DAY
+    return date
+
+
+# Memoized loops for frozenset holidays, which are hashable. Calibration loops
+# re-roll the same dates many times, so repeated adjustments become cache hits.
+_adjust_following = functools.lru_cache(maxsize=65536)(_following_loop)
+_adjust_modified_following = functools.lru_cache(maxsize=65536)(_modified_following_loop)
+_adjust_preceding = functools.lru_cache(maxsize=65536)(_preceding_loop)
+_adjust_modified_preceding = functools.lru_cache(maxsize=65536)(_modified_preceding_loop)
 
 
 class RollConvention:
@@ -11,16 +62,39 @@ class RollConvention:
         description (str): A brief description of the roll convention.
     """
 
-    def adjustDay(date: datetime.date) -> datetime.date:
-            """
-            Adjusts the given date according to the 30/360 US convention rules.
+    @staticmethod
+    def adjustDay(date: datetime.date | FastDate,
+                  holidays: set | frozenset | BusinessDayCache) -> datetime.date | FastDate:
+        """
+        Adjusts the given date according to the roll convention rules.
+        This method should be overridden by subclasses to implement specific roll conventions.
 
-            Args:
-                date: The date to be adjusted.
+        With frozenset holidays the result is memoized in a module-level LRU cache keyed on
+        (date, holidays). The cache holds a strong reference to every holiday frozenset it has
+        seen until its entries are evicted, and a hit with an equal but distinct frozenset
+        compares the sets element by element, so reuse one frozenset object per calendar.
 
-            Returns: The adjusted date.
-            """
-            raise NotImplementedError("Subclasses should implement this method.")
+        Args:
+            date: The date to be adjusted, as a date or a FastDate.
+            holidays: A set of holiday dates (a frozenset memoizes the result) or a precomputed BusinessDayCache.
+
+        Returns: The adjusted date, as a FastDate when given one.
+        """
+        raise NotImplementedError("Subclasses should implement this method.")
+
+    @staticmethod
+    def adjustArray(ordinals: np.ndarray, holidays: BusinessDayCache) -> np.ndarray:
+        """
+        Adjusts an array of date ordinals according to the roll convention rules.
+        This method should be overridden by subclasses to implement specific roll conventions.
+
+        Args:
+            ordinals: The date ordinals to be adjusted, e.g. from date_utils.to_ordinals.
+            holidays: A precomputed BusinessDayCache.
+
+        Returns: The adjusted date ordinals.
+        """
+        raise NotImplementedError("Subclasses should implement this method.")
 
 
 class Following(RollConvention):
@@ -28,19 +102,40 @@ class Following(RollConvention):
     Following roll convention: Move to the next business day if the date falls on a weekend or holiday.
     """
 
-    def adjustDay(date: datetime.date, holidays: set) -> datetime.date:
+    @staticmethod
+    def adjustDay(date: datetime.date | FastDate,
+                  holidays: set | frozenset | BusinessDayCache) -> datetime.date | FastDate:
         """
         Adjusts the given date to the next business day if it falls on a weekend or holiday.
 
         Args:
-            date: The date to be adjusted.
-            holidays: A set of holiday dates.
+            date: The date to be adjusted, as a date or a FastDate.
+            holidays: A set of holiday dates (a frozenset memoizes the result) or a precomputed BusinessDayCache.
+
+        Returns: The adjusted date, as a FastDate when given one.
+        """
+        if isinstance(holidays, BusinessDayCache):
+            if isinstance(date, FastDate):
+                return holidays.following_fast(date)
+            return holidays.following(date)
+        if isinstance(date, FastDate):
+            return fast(Following.adjustDay(datetime.date.fromordinal(date.ord), holidays))
+        if isinstance(holidays, frozenset):
+            return _adjust_following(date, holidays)
+        return _following_loop(date, holidays)
+
+    @staticmethod
+    def adjustArray(ordinals: np.ndarray, holidays: BusinessDayCache) -> np.ndarray:
+        """
+        Adjusts an array of date ordinals to the next business day in one vectorized lookup.
+
+        Args:
+            ordinals: The date ordinals to be adjusted, e.g. from date_utils.to_ordinals.
+            holidays: A precomputed BusinessDayCache.
 
-        Returns: The adjusted date.
+        Returns: The adjusted date ordinals.
         """
-        while not date_utils.is_business_day(date, holidays):
-            date += datetime.timedelta(days=1)
-        return date
+        return holidays.following_array(ordinals)
 
 
 class ModifiedFollowing(RollConvention):
@@ -49,24 +144,40 @@ class ModifiedFollowing(RollConvention):
     in which case move to the previous business day.
     """
 
-    def adjustDay(date: datetime.date, holidays: set) -> datetime.date:
+    @staticmethod
+    def adjustDay(date: datetime.date | FastDate,
+                  holidays: set | frozenset | BusinessDayCache) -> datetime.date | FastDate:
         """
         Adjusts the given date according to the Modified Following convention.
 
         Args:
-            date: The date to be adjusted.
-            holidays: A set of holiday dates.
+            date: The date to be adjusted, as a date or a FastDate.
+            holidays: A set of holiday dates (a frozenset memoizes the result) or a precomputed BusinessDayCache.
 
-        Returns: The adjusted date.
+        Returns: The adjusted date, as a FastDate when given one.
         """
-        original_month = date.month
-        while not date_utils.is_business_day(date, holidays):
-            date += datetime.timedelta(days=1)
-        if date.month != original_month:
-            date -= datetime.timedelta(days=1)
-            while not date_utils.is_business_day(date, holidays):
-                date -= datetime.timedelta(days=1)
-        return date
+        if isinstance(holidays, BusinessDayCache):
+            if isinstance(date, FastDate):
+                return holidays.modified_following_fast(date)
+            return holidays.modified_following(date)
+        if isinstance(date, FastDate):
+            return fast(ModifiedFollowing.adjustDay(datetime.date.fromordinal(date.ord), holidays))
+        if isinstance(holidays, frozenset):
+            return _adjust_modified_following(date, holidays)
+        return _modified_following_loop(date, holidays)
+
+    @staticmethod
+    def adjustArray(ordinals: np.ndarray, holidays: BusinessDayCache) -> np.ndarray:
+        """
+        Adjusts an array of date ordinals according to the Modified Following convention in one vectorized lookup.
+
+        Args:
+            ordinals: The date ordinals to be adjusted, e.g. from date_utils.to_ordinals.
+            holidays: A precomputed BusinessDayCache.
+
+        Returns: The adjusted date ordinals.
+        """
+        return holidays.modified_following_array(ordinals)
 
 
 class Preceding(RollConvention):
@@ -74,19 +185,40 @@ class Preceding(RollConvention):
     Preceding roll convention: Move to the previous business day if the date falls on a weekend or holiday.
     """
 
-    def adjustDay(date: datetime.date, holidays: set) -> datetime.date:
+    @staticmethod
+    def adjustDay(date: datetime.date | FastDate,
+                  holidays: set | frozenset | BusinessDayCache) -> datetime.date | FastDate:
         """
         Adjusts the given date to the previous business day if it falls on a weekend or holiday.
 
         Args:
-            date: The date to be adjusted.
-            holidays: A set of holiday dates.
+            date: The date to be adjusted, as a date or a FastDate.
+            holidays: A set of holiday dates (a frozenset memoizes the result) or a precomputed BusinessDayCache.
+
+        Returns: The adjusted date, as a FastDate when given one.
+        """
+        if isinstance(holidays, BusinessDayCache):
+            if isinstance(date, FastDate):
+                return holidays.preceding_fast(date)
+            return holidays.preceding(date)
+        if isinstance(date, FastDate):
+            return fast(Preceding.adjustDay(datetime.date.fromordinal(date.ord), holidays))
+        if isinstance(holidays, frozenset):
+            return _adjust_preceding(date, holidays)
+        return _preceding_loop(date, holidays)
+
+    @staticmethod
+    def adjustArray(ordinals: np.ndarray, holidays: BusinessDayCache) -> np.ndarray:
+        """
+        Adjusts an array of date ordinals to the previous business day in one vectorized lookup.
+
+        Args:
+            ordinals: The date ordinals to be adjusted, e.g. from date_utils.to_ordinals.
+            holidays: A precomputed BusinessDayCache.
 
-        Returns: The adjusted date.
+        Returns: The adjusted date ordinals.
         """
-        while not date_utils.is_business_day(date, holidays):
-            date -= datetime.timedelta(days=1)
-        return date
+        return holidays.preceding_array(ordinals)
 
 
 class ModifiedPreceding(RollConvention):
@@ -95,21 +227,43 @@ class ModifiedPreceding(RollConvention):
     in which case move to the next business day.
     """
 
-    def adjustDay(date: datetime.date, holidays: set) -> datetime.date:
+    @staticmethod
+    def adjustDay(date: datetime.date | FastDate,
+                  holidays: set | frozenset | BusinessDayCache) -> datetime.date | FastDate:
         """
         Adjusts the given date according to the Modified Preceding convention.
 
         Args:
-            date: The date to be adjusted.
-            holidays: A set of holiday dates.
-
-        Returns: The adjusted date.
-        """
-        original_month = date.month
-        while not date_utils.is_business_day(date, holidays):
-            date -= datetime.timedelta(days=1)
-        if date.month != original_month:
-            date += datetime.timedelta(days=1)
-            while not date_utils.is_business_day(date, holidays):
-                date += datetime.timedelta(days=1)
-        return date
+            date: The date to be adjusted, as a date or a FastDate.
+            holidays: A set of holiday dates (a frozenset memoizes the result) or a precomputed BusinessDayCache.
+
+        Returns: The adjusted date, as a FastDate when given one.
+        """
+        if isinstance(holidays, BusinessDayCache):
+            if isinstance(date, FastDate):
+                return holidays.modified_preceding_fast(date)
+            return holidays.modified_preceding(date)
+        if isinstance(date, FastDate):
+            return fast(ModifiedPreceding.adjustDay(datetime.date.fromordinal(date.ord), holidays))
+        if isinstance(holidays, frozenset):
+            return _adjust_modified_preceding(date, holidays)
+        return _modified_preceding_loop(date, holidays)
+
+    @staticmethod
+    def adjustArray(ordinals: np.ndarray, holidays: BusinessDayCache) -> np.ndarray:
+        """
+        Adjusts an array of date ordinals according to the Modified Preceding convention in one vectorized lookup.
+
+        Args:
+            ordinals: The date ordinals to be adjusted, e.g. from date_utils.to_ordinals.
+            holidays: A precomputed BusinessDayCache.
+
+        Returns: The adjusted date ordinals.
+        """
+        return holidays.modified_preceding_array(ordinals)
+
+
+following = Following.adjustDay
+modified_following = ModifiedFollowing.adjustDay
+preceding = Preceding.adjustDay
+modified_preceding = ModifiedPreceding.adjustDay
@@ -0,0 +1,106 @@
+import datetime
+from dataclasses import dataclass
+
+import numpy as np
+
+from .date_utils import _UNIX_EPOCH_ORDINAL, FastDate
+from .daycount_kernels import _civil_from_days
+
+# Prefer the ahead-of-time compiled kernel (see build_aot.py) when it has been built
+try:
+    from .daycount_aot import civil_from_days as _civil_from_days
+except ImportError:
+    pass
+
+# Days since 1970-01-01 supported by ymd_columns, the range of datetime.date. Dates before
+# 0000-03-01 wrap in the unsigned arithmetic of _civil_from_days, and years above 32767
+# would overflow the int16 year column.
+_MIN_DAY = datetime.date.min.toordinal() - _UNIX_EPOCH_ORDINAL
+_MAX_DAY = datetime.date.max.toordinal() - _UNIX_EPOCH_ORDINAL
+
+
+def ymd_columns(dates: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Year (int16), month (int8) and day (int8) columns of a one-dimensional array-like of datetime64[D] dates.
+
+    Dates must lie between 0001-01-01 and 9999-12-31, the range of datetime.date.
+    """
+    days = np.asarray(dates, dtype="datetime64[D]").ravel().astype(np.int64)
+    if days.size and (days.min() < _MIN_DAY or days.max() > _MAX_DAY):
+        raise ValueError("Dates must lie between 0001-01-01 and 9999-12-31.")
+    years = np.empty(days.shape[0], dtype=np.int16)
+    months = np.empty(days.shape[0], dtype=np.int8)
+    mdays = np.empty(days.shape[0], dtype=np.int8)
+    _civil_from_days(days, years, months, mdays)
+    return years, months, mdays
+
+
+@dataclass(eq=False)
+class ScheduleSoA:
+    """
+    Struct-of-arrays storage for a schedule of dates.
+
+    Each date is held as its ordinal and its year, month and day components in
+    separate contiguous columns, so day count and roll kernels only read the
+    columns they need instead of touching a Python object per date.
+
+    Attributes:
+        ords (np.ndarray): Proleptic Gregorian ordinals (int32), as used by BusinessDayCache.
+        years (np.ndarray): Calendar years (int16).
+        months (np.ndarray): Calendar months 1-12 (int8).
+        days (np.ndarray): Days of the month 1-31 (int8).
+    """
+
+    ords: np.ndarray
+    years: np.ndarray
+    months: np.ndarray
+    days: np.ndarray
+
+    def __post_init__(self):
+        # The kernels index every column up to len(ords) without bounds checks
+        self.ords = np.ascontiguousarray(self.ords, dtype=np.int32)
+        self.years = np.ascontiguousarray(self.years, dtype=np.int16)
+        self.months = np.ascontiguousarray(self.months, dtype=np.int8)
+        self.days = np.ascontiguousarray(self.days, dtype=np.int8)
+        columns = (self.ords, self.years, self.months, self.days)
+        if any(column.ndim != 1 for column in columns):
+            raise ValueError("Schedule columns must be one-dimensional.")
+        if len({column.shape[0] for column in columns}) != 1:
+            raise ValueError("Schedule columns must have the same length.")
+
+    @classmethod
+    def from_datetime64(cls, dates: np.ndarray) -> "ScheduleSoA":
+        """
+        Build the columns from a one-dimensional array-like of datetime64[D] dates.
+        """
+        dates = np.asarray(dates, dtype="datetime64[D]").ravel()
+        years, months, days = ymd_columns(dates)
+        return cls(
+            ords=(dates.astype(np.int64) + _UNIX_EPOCH_ORDINAL).astype(np.int32),
+            years=years,
+            months=months,
+            days=days,
+        )
+
+    @classmethod
+    def from_dates(cls, dates: list[datetime.date]) -> "ScheduleSoA":
+        """
+        Build the columns from a list of dates.
+        """
+        return cls.from_datetime64(np.array(dates, dtype="datetime64[D]"))
+
+    @classmethod
+    def from_fast_dates(cls, dates: list[FastDate]) -> "ScheduleSoA":
+        """
+        Build the columns from a list of FastDates without re-extracting the date fields.
+        """
+        fields = np.array(dates, dtype=np.int64).reshape(-1, 4)
+        return cls(
+            ords=fields[:, 0].astype(np.int32),
+            years=fields[:, 1].astype(np.int16),
+            months=fields[:, 2].astype(np.int8),
+            days=fields[:, 3].astype(np.int8),
+        )
+
+    def __len__(self) -> int:
+        return self.ords.shape[0]
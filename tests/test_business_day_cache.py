@@ -0,0 +1,185 @@
+import datetime
+import random
+import unittest
+
+import numpy as np
+
+from market_conventions.date_utils import BusinessDayCache, fast, is_business_day, to_ordinals
+from market_conventions import rollconvention
+from market_conventions.rollconvention import (
+    Following,
+    ModifiedFollowing,
+    ModifiedPreceding,
+    Preceding,
+)
+
+ROLL_CONVENTIONS = (Following, ModifiedFollowing, Preceding, ModifiedPreceding)
+
+
+def random_holidays(rng: random.Random, start: datetime.date, ndays: int, count: int) -> set:
+    return {start + datetime.timedelta(days=rng.randrange(ndays)) for _ in range(count)}
+
+
+class BusinessDayCacheLayoutTest(unittest.TestCase):
+
+    def test_epoch_is_aligned_to_monday(self):
+        # 2024-01-03 is a Wednesday
+        cache = BusinessDayCache(set(), datetime.date(2024, 1, 3), datetime.date(2024, 1, 14))
+        self.assertEqual(datetime.date.fromordinal(cache.epoch), datetime.date(2024, 1, 1))
+        self.assertEqual(cache.is_bday.tolist(), [True] * 5 + [False] * 2 + [True] * 5 + [False] * 2)
+
+    def test_holidays_outside_range_are_ignored(self):
+        holidays = {datetime.date(2023, 12, 25), datetime.date(2024, 1, 2), datetime.date(2024, 2, 1)}
+        cache = BusinessDayCache(holidays, datetime.date(2024, 1, 1), datetime.date(2024, 1, 7))
+        self.assertEqual(cache.is_bday.tolist(), [True, False, True, True, True, False, False])
+
+    def test_month_of(self):
+        cache = BusinessDayCache(set(), datetime.date(2024, 1, 29), datetime.date(2024, 2, 4))
+        self.assertEqual(cache.month_of.tolist(), [1, 1, 1, 2, 2, 2, 2])
+
+    def test_links_use_sentinel_at_range_ends(self):
+        # Sunday 2023-12-31 gives an epoch of Monday 2023-12-25, a holiday
+        holidays = {datetime.date(2023, 12, 25)}
+        cache = BusinessDayCache(holidays, datetime.date(2023, 12, 31), datetime.date(2024, 1, 7))
+        self.assertEqual(cache.prev_bday[0], -1)
+        self.assertEqual(cache.next_bday[0], 1)
+        # The range ends on a weekend
+        self.assertEqual(cache.next_bday[-2:].tolist(), [-1, -1])
+        self.assertEqual(cache.prev_bday[-2:].tolist(), [11, 11])
+
+
+class BusinessDayCacheParityTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(0)
+        start = datetime.date(2000, 1, 1)
+        cls.holidays = random_holidays(rng, start, 9000, 1500)
+        cls.cache = BusinessDayCache(cls.holidays, datetime.date(1999, 12, 1), datetime.date(2026, 1, 1))
+        cls.dates = [start + datetime.timedelta(days=rng.randrange(9000)) for _ in range(2000)]
+
+    def test_is_business_day_matches_holiday_set(self):
+        for date in self.dates:
+            self.assertEqual(is_business_day(date, self.cache), is_business_day(date, self.holidays), date)
+
+    def test_adjust_day_matches_holiday_set(self):
+        for convention in ROLL_CONVENTIONS:
+            for date in self.dates:
+                self.assertEqual(
+                    convention.adjustDay(date, self.cache),
+                    convention.adjustDay(date, self.holidays),
+                    (convention.__name__, date),
+                )
+
+    def test_adjust_day_fast_date_matches_date(self):
+        for convention in ROLL_CONVENTIONS:
+            for date in self.dates:
+                self.assertEqual(
+                    convention.adjustDay(fast(date), self.cache),
+                    fast(convention.adjustDay(date, self.cache)),
+                    (convention.__name__, date),
+                )
+
+    def test_adjust_day_fast_date_with_holiday_set(self):
+        frozen = frozenset(self.holidays)
+        for convention in ROLL_CONVENTIONS:
+            for date in self.dates[:200]:
+                expected = fast(convention.adjustDay(date, self.holidays))
+                self.assertEqual(convention.adjustDay(fast(date), self.holidays), expected, (convention.__name__, date))
+                self.assertEqual(convention.adjustDay(fast(date), frozen), expected, (convention.__name__, date))
+
+    def test_adjust_array_matches_adjust_day(self):
+        ordinals = to_ordinals(self.dates)
+        for convention in ROLL_CONVENTIONS:
+            expected = [convention.adjustDay(date, self.holidays).toordinal() for date in self.dates]
+            adjusted = convention.adjustArray(ordinals, self.cache)
+            self.assertEqual(adjusted.dtype, np.int32)
+            self.assertEqual(adjusted.tolist(), expected, convention.__name__)
+
+
+class FrozensetMemoizationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.holidays = {datetime.date(2024, 12, 25), datetime.date(2024, 12, 26), datetime.date(2025, 1, 1)}
+        self.frozen = frozenset(self.holidays)
+        start = datetime.date(2024, 12, 1)
+        self.dates = [start + datetime.timedelta(days=i) for i in range(62)]
+        for cached in (rollconvention._adjust_following, rollconvention._adjust_modified_following,
+                       rollconvention._adjust_preceding, rollconvention._adjust_modified_preceding):
+            cached.cache_clear()
+
+    def test_memoized_matches_unmemoized(self):
+        for convention in ROLL_CONVENTIONS:
+            for date in self.dates:
+                self.assertEqual(
+                    convention.adjustDay(date, self.frozen),
+                    convention.adjustDay(date, self.holidays),
+                    (convention.__name__, date),
+                )
+
+    def test_second_call_hits_cache(self):
+        date = datetime.date(2024, 12, 25)
+        first = Following.adjustDay(date, self.frozen)
+        self.assertEqual(rollconvention._adjust_following.cache_info().hits, 0)
+        self.assertEqual(Following.adjustDay(date, self.frozen), first)
+        self.assertEqual(rollconvention._adjust_following.cache_info().hits, 1)
+        # An equal but distinct frozenset is the same cache key
+        self.assertEqual(Following.adjustDay(date, frozenset(self.holidays)), first)
+        self.assertEqual(rollconvention._adjust_following.cache_info().hits, 2)
+
+    def test_plain_set_is_not_memoized(self):
+        Following.adjustDay(datetime.date(2024, 12, 25), self.holidays)
+        self.assertEqual(rollconvention._adjust_following.cache_info().currsize, 0)
+
+
+class BusinessDayCacheRangeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = BusinessDayCache(set(), datetime.date(2024, 1, 1), datetime.date(2024, 1, 6))
+
+    def test_inverted_range_raises(self):
+        with self.assertRaises(ValueError):
+            BusinessDayCache(set(), datetime.date(2024, 1, 10), datetime.date(2023, 1, 1))
+        # dt_max after the Monday epoch but before dt_min
+        with self.assertRaises(ValueError):
+            BusinessDayCache(set(), datetime.date(2024, 1, 10), datetime.date(2024, 1, 9))
+        self.assertEqual(BusinessDayCache(set(), datetime.date(2024, 1, 10), datetime.date(2024, 1, 10)).epoch,
+                         datetime.date(2024, 1, 8).toordinal())
+
+    def test_index_outside_range_raises(self):
+        with self.assertRaises(ValueError):
+            self.cache.index(datetime.date(2023, 12, 31))
+        with self.assertRaises(ValueError):
+            self.cache.index(datetime.date(2024, 1, 7))
+
+    def test_no_business_day_in_range_raises(self):
+        # Saturday 2024-01-06 is the last date covered
+        with self.assertRaises(ValueError):
+            Following.adjustDay(datetime.date(2024, 1, 6), self.cache)
+        self.assertEqual(Preceding.adjustDay(datetime.date(2024, 1, 6), self.cache), datetime.date(2024, 1, 5))
+
+    def test_fast_date_outside_range_raises(self):
+        with self.assertRaises(ValueError):
+            self.cache.index_fast(fast(datetime.date(2024, 1, 7)))
+        with self.assertRaises(ValueError):
+            Following.adjustDay(fast(datetime.date(2024, 1, 6)), self.cache)
+
+    def test_index_array_outside_range_raises(self):
+        ordinals = to_ordinals([datetime.date(2024, 1, 2), datetime.date(2024, 1, 7)])
+        with self.assertRaises(ValueError):
+            self.cache.index_array(ordinals)
+        self.assertEqual(self.cache.index_array(ordinals[:1]).tolist(), [1])
+
+    def test_ordinal_array_sentinel_raises(self):
+        with self.assertRaises(ValueError):
+            self.cache.ordinal_array(np.array([0, -1]))
+        with self.assertRaises(ValueError):
+            Following.adjustArray(to_ordinals([datetime.date(2024, 1, 5), datetime.date(2024, 1, 6)]), self.cache)
+
+    def test_empty_array(self):
+        for convention in ROLL_CONVENTIONS:
+            self.assertEqual(convention.adjustArray(to_ordinals([]), self.cache).tolist(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+import datetime
+import random
+import unittest
+
+import numpy as np
+
+from market_conventions.date_utils import fast
+from market_conventions.daycount_kernels import _thirty360_us
+from market_conventions.daycountconventions import (
+    DAY_COUNTS,
+    Actual360,
+    Actual365,
+    ActualActual,
+    Thirty360,
+    Thirty360EU,
+    Thirty360US,
+)
+from market_conventions.schedule import ScheduleSoA
+
+DAY_COUNT_CLASSES = (Actual360, Actual365, ActualActual, Thirty360, Thirty360US, Thirty360EU)
+
+# Month-end pairs that exercise the 31st/30th day clamping of the 30/360 conventions
+END_OF_MONTH_PAIRS = [
+    (datetime.date(2024, 1, 31), datetime.date(2024, 3, 31)),
+    (datetime.date(2024, 1, 30), datetime.date(2024, 3, 31)),
+    (datetime.date(2024, 1, 29), datetime.date(2024, 3, 31)),
+    (datetime.date(2024, 1, 31), datetime.date(2024, 4, 30)),
+    (datetime.date(2024, 2, 29), datetime.date(2024, 3, 31)),
+    (datetime.date(2023, 2, 28), datetime.date(2023, 8, 31)),
+    (datetime.date(2024, 3, 31), datetime.date(2024, 1, 31)),
+    (datetime.date(2024, 5, 31), datetime.date(2024, 5, 31)),
+]
+
+
+def random_pairs(rng: random.Random, start: datetime.date, end: datetime.date, count: int) -> list:
+    lo, hi = start.toordinal(), end.toordinal()
+    return [
+        (datetime.date.fromordinal(rng.randint(lo, hi)), datetime.date.fromordinal(rng.randint(lo, hi)))
+        for _ in range(count)
+    ]
+
+
+def thirty360_us_branching(y1: int, m1: int, d1: int, y2: int, m2: int, d2: int) -> float:
+    # The original branching rule that the branchless kernel replaced
+    if d1 == 31:
+        d1 = 30
+    if d2 == 31 and d1 == 30:
+        d2 = 30
+    return ((360 * (y2 - y1)) + (30 * (m2 - m1)) + (d2 - d1)) / 360.0
+
+
+class DayCountParityTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(0)
+        cls.table_pairs = random_pairs(rng, datetime.date(1900, 1, 1), datetime.date(2199, 12, 31), 1000)
+        # Years outside 1900-2199 fall back from the year length table in Actual/Actual
+        cls.pairs = random_pairs(rng, datetime.date(1800, 1, 1), datetime.date(2300, 12, 31), 3000) + END_OF_MONTH_PAIRS
+        cls.starts = [start for start, _ in cls.pairs]
+        cls.ends = [end for _, end in cls.pairs]
+
+    def expected(self, day_count, pairs=None) -> list:
+        return [day_count.yearFraction(start, end) for start, end in (pairs or self.pairs)]
+
+    def test_array_matches_scalar(self):
+        for pairs in (self.table_pairs, self.pairs):
+            starts = np.array([start for start, _ in pairs], dtype="datetime64[D]")
+            ends = np.array([end for _, end in pairs], dtype="datetime64[D]")
+            for day_count in DAY_COUNT_CLASSES:
+                result = day_count.yearFractionArray(starts, ends)
+                self.assertEqual(result.dtype, np.float64)
+                self.assertEqual(result.tolist(), self.expected(day_count, pairs), day_count.__name__)
+
+    def test_schedule_matches_scalar(self):
+        for pairs in (self.table_pairs, self.pairs):
+            starts = ScheduleSoA.from_dates([start for start, _ in pairs])
+            ends = ScheduleSoA.from_dates([end for _, end in pairs])
+            for day_count in DAY_COUNT_CLASSES:
+                result = day_count.yearFractionSchedule(starts, ends)
+                self.assertEqual(result.tolist(), self.expected(day_count, pairs), day_count.__name__)
+
+    def test_fast_matches_scalar(self):
+        for day_count in DAY_COUNT_CLASSES:
+            result = [day_count.yearFractionFast(fast(start), fast(end)) for start, end in self.pairs]
+            self.assertEqual(result, self.expected(day_count), day_count.__name__)
+
+    def test_array_broadcasts_two_dimensional_input(self):
+        starts = np.array(self.starts[:20], dtype="datetime64[D]").reshape(-1, 1)
+        ends = np.array(self.ends[:15], dtype="datetime64[D]").reshape(1, -1)
+        for day_count in DAY_COUNT_CLASSES:
+            expected = [[day_count.yearFraction(start, end) for end in self.ends[:15]] for start in self.starts[:20]]
+            result = day_count.yearFractionArray(starts, ends)
+            self.assertEqual(result.shape, (20, 15))
+            self.assertEqual(result.tolist(), expected, day_count.__name__)
+
+    def test_array_accepts_date_lists(self):
+        for day_count in DAY_COUNT_CLASSES:
+            self.assertEqual(day_count.yearFractionArray(self.starts, self.ends).tolist(), self.expected(day_count))
+
+    def test_empty_input(self):
+        empty = np.array([], dtype="datetime64[D]")
+        for day_count in DAY_COUNT_CLASSES:
+            self.assertEqual(day_count.yearFractionArray(empty, empty).tolist(), [])
+            schedule = ScheduleSoA.from_datetime64(empty)
+            self.assertEqual(day_count.yearFractionSchedule(schedule, schedule).tolist(), [])
+
+    def test_mismatched_schedules_raise(self):
+        starts = ScheduleSoA.from_dates(self.starts[:2])
+        ends = ScheduleSoA.from_dates(self.ends[:3])
+        for day_count in DAY_COUNT_CLASSES:
+            with self.assertRaises(ValueError):
+                day_count.yearFractionSchedule(starts, ends)
+
+    def test_day_counts_registry(self):
+        for day_count in DAY_COUNTS.values():
+            start, end = self.pairs[0]
+            self.assertEqual(day_count.yearFraction(start, end), type(day_count).yearFraction(start, end))
+
+
+class Thirty360USKernelTest(unittest.TestCase):
+
+    CASES = [
+        ((2024, 1, 31), (2024, 3, 31)),
+        ((2024, 1, 30), (2024, 3, 31)),
+        ((2024, 1, 29), (2024, 3, 31)),
+        ((2024, 2, 29), (2024, 3, 31)),
+        ((2023, 2, 28), (2023, 3, 31)),
+        ((2024, 3, 31), (2024, 4, 30)),
+        ((2024, 1, 30), (2024, 1, 31)),
+    ]
+
+    def test_kernel_matches_branching_rule(self):
+        for start, end in self.CASES:
+            self.assertEqual(_thirty360_us(*start, *end), thirty360_us_branching(*start, *end), (start, end))
+
+    def test_kernel_clamps_end_day(self):
+        # d2 = 31 drops to 30 only when d1 is 30 or 31
+        self.assertEqual(_thirty360_us(2024, 1, 31, 2024, 3, 31), 60 / 360.0)
+        self.assertEqual(_thirty360_us(2024, 1, 30, 2024, 3, 31), 60 / 360.0)
+        self.assertEqual(_thirty360_us(2024, 1, 29, 2024, 3, 31), 62 / 360.0)
+        self.assertEqual(_thirty360_us(2024, 2, 29, 2024, 3, 31), 32 / 360.0)
+
+    def test_kernel_matches_branching_rule_for_all_day_pairs(self):
+        for d1 in range(1, 32):
+            for d2 in range(1, 32):
+                self.assertEqual(
+                    _thirty360_us(2024, 1, d1, 2024, 3, d2), thirty360_us_branching(2024, 1, d1, 2024, 3, d2), (d1, d2)
+                )
+
+    def test_array_kernel_matches_branching_rule(self):
+        starts = [datetime.date(*start) for start, _ in self.CASES]
+        ends = [datetime.date(*end) for _, end in self.CASES]
+        expected = [thirty360_us_branching(*start, *end) for start, end in self.CASES]
+        self.assertEqual(Thirty360US.yearFractionArray(starts, ends).tolist(), expected)
+        schedule = Thirty360US.yearFractionSchedule(ScheduleSoA.from_dates(starts), ScheduleSoA.from_dates(ends))
+        self.assertEqual(schedule.tolist(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import datetime
+import unittest
+
+import numpy as np
+
+from market_conventions.date_utils import fast
+from market_conventions.schedule import ScheduleSoA, ymd_columns
+
+
+def date_fields(dates: list[datetime.date]) -> list[tuple[int, int, int]]:
+    return [(d.year, d.month, d.day) for d in dates]
+
+
+def ymd_fields(dates: list[datetime.date]) -> list[tuple[int, int, int]]:
+    years, months, mdays = ymd_columns(np.array(dates, dtype="datetime64[D]"))
+    return list(zip(years.tolist(), months.tolist(), mdays.tolist()))
+
+
+class YmdColumnsTest(unittest.TestCase):
+
+    def test_every_day_around_the_year_length_table(self):
+        start = datetime.date(1890, 1, 1).toordinal()
+        dates = [datetime.date.fromordinal(o) for o in range(start, datetime.date(2210, 1, 1).toordinal())]
+        self.assertEqual(ymd_fields(dates), date_fields(dates))
+
+    def test_full_date_range(self):
+        ordinals = range(datetime.date.min.toordinal(), datetime.date.max.toordinal() + 1, 97)
+        dates = [datetime.date.fromordinal(o) for o in ordinals] + [datetime.date.min, datetime.date.max]
+        self.assertEqual(ymd_fields(dates), date_fields(dates))
+
+    def test_leap_days_and_century_years(self):
+        dates = []
+        for year in (4, 100, 400, 1600, 1900, 2000, 2024, 2100, 2400, 9996):
+            dates += [datetime.date(year, 2, 28), datetime.date(year, 3, 1), datetime.date(year, 12, 31)]
+            if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+                dates.append(datetime.date(year, 2, 29))
+        self.assertEqual(ymd_fields(dates), date_fields(dates))
+
+    def test_dtypes_and_empty_input(self):
+        years, months, mdays = ymd_columns(np.array([], dtype="datetime64[D]"))
+        self.assertEqual([years.dtype, months.dtype, mdays.dtype], [np.int16, np.int8, np.int8])
+        self.assertEqual(years.tolist(), [])
+
+    def test_dates_outside_supported_range_raise(self):
+        for date in ("0000-12-31", "-0001-06-01", "10000-01-01", "40000-01-01", "NaT"):
+            with self.assertRaises(ValueError, msg=date):
+                ymd_columns(np.array([date], dtype="datetime64[D]"))
+
+
+class ScheduleSoATest(unittest.TestCase):
+
+    def setUp(self):
+        self.dates = [datetime.date(2024, 1, 31), datetime.date(2024, 2, 29), datetime.date(2100, 12, 31)]
+
+    def test_columns_are_cast_to_compact_dtypes(self):
+        schedule = ScheduleSoA(
+            ords=np.array([d.toordinal() for d in self.dates], dtype=np.int64),
+            years=[d.year for d in self.dates],
+            months=[d.month for d in self.dates],
+            days=[d.day for d in self.dates],
+        )
+        self.assertEqual(
+            [schedule.ords.dtype, schedule.years.dtype, schedule.months.dtype, schedule.days.dtype],
+            [np.int32, np.int16, np.int8, np.int8],
+        )
+
+    def test_constructors_agree(self):
+        from_dates = ScheduleSoA.from_dates(self.dates)
+        from_fast_dates = ScheduleSoA.from_fast_dates([fast(d) for d in self.dates])
+        for name in ("ords", "years", "months", "days"):
+            self.assertEqual(getattr(from_dates, name).tolist(), getattr(from_fast_dates, name).tolist(), name)
+        self.assertEqual(from_dates.ords.tolist(), [d.toordinal() for d in self.dates])
+        self.assertEqual(len(from_dates), 3)
+
+    def test_mismatched_column_lengths_raise(self):
+        with self.assertRaises(ValueError):
+            ScheduleSoA(ords=np.arange(3), years=[2024], months=[1], days=[1])
+
+    def test_multidimensional_columns_raise(self):
+        with self.assertRaises(ValueError):
+            ScheduleSoA(ords=np.zeros((1, 2)), years=np.zeros((1, 2)), months=np.zeros((1, 2)), days=np.zeros((1, 2)))
+
+    def test_equality_is_identity(self):
+        schedule = ScheduleSoA.from_dates(self.dates)
+        self.assertEqual(schedule, schedule)
+        self.assertNotEqual(schedule, ScheduleSoA.from_dates(self.dates))
+
+
+if __name__ == "__main__":
+    unittest.main()